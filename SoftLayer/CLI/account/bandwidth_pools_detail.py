@@ -1,5 +1,7 @@
 """Get bandwidth pools."""
 # :license: MIT, see LICENSE for more details.
+import time
+
 import click
 
 from SoftLayer import AccountManager
@@ -8,6 +10,14 @@
 from SoftLayer.CLI import formatting
 from SoftLayer import utils
 
+# Bandwidth pool details keyed by (endpoint, user, identifier), stored as (timestamp, value) tuples.
+# The key does not depend on the client object because slcli shell builds a new client for every
+# command; a one-shot slcli invocation never hits it. Expired entries are dropped on every cache miss.
+_BW_CACHE = {}
+BW_CACHE_TTL = 60
+
+_MEMBER_HEADERS = ('Id', 'HostName', 'IP Address', 'Amount', 'Current Usage')
+
 
 @click.command(cls=SLCommand)
 @click.argument('identifier')
@@ -15,8 +25,7 @@
 def cli(env, identifier):
     """Get bandwidth pool details."""
 
-    manager = AccountManager(env.client)
-    bandwidths = manager.getBandwidthDetail(identifier)
+    bandwidths = _get_bandwidth_detail(env.client, identifier)
 
     table = formatting.KeyValueTable(['name', 'value'])
     table.align['name'] = 'r'
@@ -24,57 +33,75 @@ def cli(env, identifier):
     table.add_row(['Id', bandwidths['id']])
     table.add_row(['Name', bandwidths['name']])
     table.add_row(['Create Date', utils.clean_time(bandwidths.get('createDate'), '%Y-%m-%d')])
-    current = "{} GB".format(utils.lookup(bandwidths, 'billingCyclePublicBandwidthUsage', 'amountOut'))
+    current = f"{(bandwidths.get('billingCyclePublicBandwidthUsage') or {}).get('amountOut')} GB"
     if current is None:
         current = '-'
     table.add_row(['Current Usage', current])
-    projected = "{} GB".format(bandwidths.get('projectedPublicBandwidthUsage', 0))
+    projected = f"{bandwidths.get('projectedPublicBandwidthUsage', 0)} GB"
     if projected is None:
         projected = '-'
     table.add_row(['Projected  Usage', projected])
-    inbound = "{} GB".format(bandwidths.get('inboundPublicBandwidthUsage', 0))
+    inbound = f"{bandwidths.get('inboundPublicBandwidthUsage', 0)} GB"
     if inbound is None:
         inbound = '-'
     table.add_row(['Inbound   Usage', inbound])
-    if bandwidths['hardware'] != []:
-        table.add_row(['hardware', *(_bw_table(bandwidths['hardware']))])
+    if bandwidths.get('hardware'):
+        table.add_row(['hardware', *(_member_table(bandwidths['hardware']))])
     else:
         table.add_row(['hardware', 'Not Found'])
 
-    if bandwidths['virtualGuests'] != []:
-        table.add_row(['virtualGuests', *(_virtual_table(bandwidths['virtualGuests']))])
+    if bandwidths.get('virtualGuests'):
+        table.add_row(['virtualGuests', *(_member_table(bandwidths['virtualGuests']))])
     else:
         table.add_row(['virtualGuests', 'Not Found'])
 
-    if bandwidths['bareMetalInstances'] != []:
-        table.add_row(['Netscaler', *(_bw_table(bandwidths['bareMetalInstances']))])
+    if bandwidths.get('bareMetalInstances'):
+        table.add_row(['Netscaler', *(_member_table(bandwidths['bareMetalInstances']))])
     else:
         table.add_row(['Netscaler', 'Not Found'])
 
     env.fout(table)
 
 
-def _bw_table(bw_data):
-    """Generates a bandwidth useage table"""
-    table_data = formatting.Table(['Id', 'HostName', "IP Address", 'Amount', "Current Usage"])
+def _member_table(bw_data):
+    """Generates a bandwidth useage table for pool members"""
+    table_data = formatting.Table(list(_MEMBER_HEADERS))
+    rows = []
     for bw_point in bw_data:
-        amount = "{} GB".format(utils.lookup(bw_point, 'bandwidthAllotmentDetail', 'allocation', 'amount'))
-        current = "{} GB".format(bw_point.get('outboundBandwidthUsage', 0))
+        allotment = bw_point.get('bandwidthAllotmentDetail') or {}
+        alloc = allotment.get('allocation') or {}
+        amount = f"{alloc.get('amount')} GB"
+        current = f"{bw_point.get('outboundBandwidthUsage', 0)} GB"
         ip_address = bw_point.get('primaryIpAddress')
         if ip_address is None:
             ip_address = '-'
-        table_data.add_row([bw_point['id'], bw_point['fullyQualifiedDomainName'], ip_address, amount, current])
+        rows.append([bw_point['id'], bw_point['fullyQualifiedDomainName'], ip_address, amount, current])
+    table_data.add_rows(rows)
     return [table_data]
 
 
-def _virtual_table(bw_data):
-    """Generates a virtual bandwidth usage table"""
-    table_data = formatting.Table(['Id', 'HostName', "IP Address", 'Amount', "Current Usage"])
-    for bw_point in bw_data:
-        amount = "{} GB".format(utils.lookup(bw_point, 'bandwidthAllotmentDetail', 'allocation', 'amount'))
-        current = "{} GB".format(bw_point.get('outboundBandwidthUsage', 0))
-        ip_address = bw_point.get('primaryIpAddress')
-        if ip_address is None:
-            ip_address = '-'
-        table_data.add_row([bw_point['id'], bw_point['fullyQualifiedDomainName'], ip_address, amount, current])
-    return [table_data]
+def _get_bandwidth_detail(client, identifier):
+    """Returns the bandwidth pool details, reusing a cached response for up to BW_CACHE_TTL seconds"""
+    now = time.time()
+    cache_key = _client_identity(client) + (identifier,)
+    cached = _BW_CACHE.get(cache_key)
+    if cached is not None and now - cached[0] < BW_CACHE_TTL:
+        return cached[1]
+
+    for key, entry in list(_BW_CACHE.items()):
+        if now - entry[0] >= BW_CACHE_TTL:
+            del _BW_CACHE[key]
+
+    bandwidths = AccountManager(client).getBandwidthDetail(identifier)
+    _BW_CACHE[cache_key] = (now, bandwidths)
+    return bandwidths
+
+
+def _client_identity(client):
+    """Returns the (endpoint, user) a client talks to, which stays the same when the client is rebuilt"""
+    transport = client.transport
+    # Timing and Debug transports wrap the transport that actually holds the endpoint
+    while hasattr(transport, 'transport'):
+        transport = transport.transport
+    user = getattr(client.auth, 'username', None) or getattr(client.auth, 'user_id', None)
+    return (getattr(transport, 'endpoint_url', None), user)
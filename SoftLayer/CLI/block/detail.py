@@ -6,7 +6,6 @@
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import formatting
 from SoftLayer.CLI import helpers
-from SoftLayer import utils
 
 
 @click.command(cls=SoftLayer.CLI.command.SLCommand, )
@@ -17,18 +16,17 @@ def cli(env, volume_id):
     block_manager = SoftLayer.BlockStorageManager(env.client)
     block_volume_id = helpers.resolve_id(block_manager.resolve_ids, volume_id, 'Block Volume')
     block_volume = block_manager.get_block_volume_details(block_volume_id)
-    block_volume = utils.NestedDict(block_volume)
 
     table = formatting.KeyValueTable(['Name', 'Value'])
     table.align['Name'] = 'r'
     table.align['Value'] = 'l'
 
-    storage_type = block_volume['storageType']['keyName'].split('_').pop(0)
+    storage_type = (block_volume.get('storageType') or {}).get('keyName', '').split('_').pop(0)
     table.add_row(['ID', block_volume['id']])
-    table.add_row(['Username', block_volume['username']])
+    table.add_row(['Username', block_volume.get('username')])
     table.add_row(['Type', storage_type])
-    table.add_row(['Capacity (GB)', "%iGB" % block_volume['capacityGb']])
-    table.add_row(['LUN Id', "%s" % block_volume['lunId']])
+    table.add_row(['Capacity (GB)', f"{block_volume['capacityGb']}GB"])
+    table.add_row(['LUN Id', "%s" % block_volume.get('lunId')])
 
     if block_volume.get('provisionedIops'):
         table.add_row(['IOPs', float(block_volume['provisionedIops'])])
@@ -39,65 +37,63 @@ def cli(env, volume_id):
             block_volume['storageTierLevel'],
         ])
 
+    datacenter = ((block_volume.get('serviceResource') or {}).get('datacenter') or {}).get('name', '')
     table.add_row([
         'Data Center',
-        block_volume['serviceResource']['datacenter']['name'],
+        datacenter,
     ])
     table.add_row([
         'Target IP',
-        block_volume['serviceResourceBackendIpAddress'],
+        block_volume.get('serviceResourceBackendIpAddress'),
     ])
 
-    if block_volume['snapshotCapacityGb']:
+    if block_volume.get('snapshotCapacityGb'):
         table.add_row([
             'Snapshot Capacity (GB)',
             block_volume['snapshotCapacityGb'],
         ])
-        if 'snapshotSizeBytes' in block_volume['parentVolume']:
+        if 'snapshotSizeBytes' in (block_volume.get('parentVolume') or {}):
             table.add_row([
                 'Snapshot Used (Bytes)',
                 block_volume['parentVolume']['snapshotSizeBytes'],
             ])
 
     table.add_row(['# of Active Transactions', "%i"
-                   % block_volume['activeTransactionCount']])
+                   % block_volume.get('activeTransactionCount', 0)])
 
-    if block_volume['activeTransactions']:
-        for trans in block_volume['activeTransactions']:
-            if 'transactionStatus' in trans and 'friendlyName' in trans['transactionStatus']:
-                table.add_row(['Ongoing Transaction', trans['transactionStatus']['friendlyName']])
+    for trans in block_volume.get('activeTransactions') or ():
+        name = (trans.get('transactionStatus') or {}).get('friendlyName')
+        if name:
+            table.add_row(['Ongoing Transaction', name])
 
-    table.add_row(['Replicant Count', "%u" % block_volume.get('replicationPartnerCount', 0)])
+    partner_count = block_volume.get('replicationPartnerCount', 0)
+    table.add_row(['Replicant Count', "%u" % partner_count])
 
-    if block_volume['replicationPartnerCount'] > 0:
+    if partner_count > 0:
         # This if/else temporarily handles a bug in which the SL API
         # returns a string or object for 'replicationStatus'; it seems that
         # the type is string for File volumes and object for Block volumes
-        if 'message' in block_volume['replicationStatus']:
+        replication_status = block_volume.get('replicationStatus') or {}
+        if 'message' in replication_status:
             table.add_row(['Replication Status', "%s"
-                           % block_volume['replicationStatus']['message']])
+                           % replication_status['message']])
         else:
             table.add_row(['Replication Status', "%s"
-                           % block_volume['replicationStatus']])
+                           % replication_status])
 
-        for replicant in block_volume['replicationPartners']:
+        partners = block_volume.get('replicationPartners') or []
+        for replicant in partners:
             replicant_table = formatting.Table(['Name',
                                                 'Value'])
-            replicant_table.add_row(['Replicant Id', replicant['id']])
-            replicant_table.add_row([
-                'Volume Name',
-                utils.lookup(replicant, 'username')])
-            replicant_table.add_row([
-                'Target IP',
-                utils.lookup(replicant, 'serviceResourceBackendIpAddress')])
-            replicant_table.add_row([
-                'Data Center',
-                utils.lookup(replicant,
-                             'serviceResource', 'datacenter', 'name')])
-            replicant_table.add_row([
-                'Schedule',
-                utils.lookup(replicant,
-                             'replicationSchedule', 'type', 'keyname')])
+            replicant_datacenter = (replicant.get('serviceResource') or {}).get('datacenter') or {}
+            schedule_type = (replicant.get('replicationSchedule') or {}).get('type') or {}
+            replicant_table.add_rows([
+                ['Replicant Id', replicant['id']],
+                ['Volume Name', replicant.get('username')],
+                ['Target IP', replicant.get('serviceResourceBackendIpAddress')],
+                ['Data Center', replicant_datacenter.get('name')],
+                ['Schedule', schedule_type.get('keyname')],
+            ])
             table.add_row(['Replicant Volumes', replicant_table])
 
     if block_volume.get('originalVolumeSize'):
@@ -79,7 +79,7 @@ def cli(env):
                                         'Private Ip',
                                         'Associated vlan',
                                         'status'], title='Multi Vlan Firewall')
-    fw_gatewwalls = mgr.get_firewalls_gatewalls()
+    fw_gatewwalls = mgr.get_firewalls_gatewalls(include_members=True)
 
     for gatewalls in fw_gatewwalls:
         table_gatewalls.add_row([gatewalls['networkFirewall']['id'], gatewalls.get('name'),
@@ -258,6 +258,13 @@ def add_row(self, row):
         """
         self.rows.append(row)
 
+    def add_rows(self, rows):
+        """Add several rows to the table at once.
+
+        :param list rows: a list of rows, each a list of strings to be added
+        """
+        self.rows.extend(rows)
+
     def to_python(self):
         """Decode this Table object to standard Python types."""
         # Adding rows
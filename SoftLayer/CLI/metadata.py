@@ -1,9 +1,12 @@
 """Find details about this machine."""
 # :license: MIT, see LICENSE for more details.
+from concurrent.futures import ThreadPoolExecutor
+import functools
 
 import click
 
 import SoftLayer
+from SoftLayer.CLI.command import SLCommand as SLCommand
 from SoftLayer.CLI import environment
 from SoftLayer.CLI import exceptions
 from SoftLayer.CLI import formatting
@@ -36,8 +39,12 @@
 
 """.format(choices="\n    ".join(META_CHOICES))
 
+# Machine metadata does not change while the process is running, so the manager
+# and the values it returns are shared across calls.
+_META = None
 
-@click.command(cls=SoftLayer.CLI.command.SLCommand, help=HELP,
+
+@click.command(cls=SLCommand, help=HELP,
                short_help="Find details about this machine.",
                epilog="These commands only work on devices on the backend "
                       "SoftLayer network. This allows for self-discovery for "
@@ -53,7 +60,7 @@ def cli(env, prop):
             return
 
         meta_prop = META_MAPPING.get(prop) or prop
-        env.fout(SoftLayer.MetadataManager().get(meta_prop))
+        env.fout(_get_meta_prop(meta_prop))
     except SoftLayer.TransportError as ex:
         message = 'Cannot connect to the backend service address. Make sure '\
                   'this command is being ran from a device on the backend network.'
@@ -62,11 +69,14 @@ def cli(env, prop):
 
 def get_network():
     """Returns a list of tables with public and private network details."""
-    meta = SoftLayer.MetadataManager()
-    network_tables = []
-    for network_func in [meta.public_network, meta.private_network]:
-        network = network_func()
+    # The public and private lookups are independent requests, so run them concurrently.
+    # Create the shared manager first so both workers use it instead of racing to build one.
+    _get_meta()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        networks = list(executor.map(_get_network_side, ['public', 'private']))
 
+    network_tables = []
+    for network in networks:
         table = formatting.KeyValueTable(['name', 'value'])
         table.align['name'] = 'r'
         table.align['value'] = 'l'
@@ -81,3 +91,25 @@ def get_network():
         network_tables.append(table)
 
     return network_tables
+
+
+def _get_meta():
+    """Returns the shared MetadataManager, creating it on first use."""
+    global _META  # pylint: disable=global-statement
+    if _META is None:
+        _META = SoftLayer.MetadataManager()
+    return _META
+
+
+@functools.lru_cache(maxsize=None)
+def _get_meta_prop(prop):
+    """Returns the metadata value for the given property."""
+    return _get_meta().get(prop)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_network_side(side):
+    """Returns the 'public' or 'private' network details of this machine."""
+    if side == 'public':
+        return _get_meta().public_network()
+    return _get_meta().private_network()
@@ -13,6 +13,31 @@
              'destinationPortRangeEnd,sourceIpAddress,sourceIpSubnetMask,'
              'version,notes]')
 
+_BILLING_MASK = 'mask[id,billingItem[id]]'
+
+_INSTANCE_MASK = ('mask[firewallType,datacenter,managementCredentials,networkVlan,'
+                  'metricTrackingObject[data,type],networkGateway[insideVlans,members,privateIpAddress,'
+                  'publicIpAddress,publicIpv6Address,privateVlan,publicVlan,status]]')
+
+_GATEWALL_FIELDS = ('id,networkSpace,name,'
+                    'networkFirewall[id,firewallType,datacenter[name]],'
+                    'status[keyName],'
+                    'insideVlans[id],'
+                    'privateIpAddress[ipAddress],'
+                    'publicVlan[id],'
+                    'publicIpAddress[ipAddress]')
+
+_GATEWALL_MASK = 'mask[%s]' % _GATEWALL_FIELDS
+
+_GATEWALL_MEMBERS_MASK = 'mask[%s,members[id,hardware[hostname]]]' % _GATEWALL_FIELDS
+
+# VLAN properties that indicate a firewall, most commonly set first
+_FIREWALL_KEYS = ('dedicatedFirewallFlag',
+                  'highAvailabilityFirewallFlag',
+                  'firewallInterfaces',
+                  'firewallNetworkComponents',
+                  'firewallGuestNetworkComponents')
+
 
 def has_firewall(vlan):
     """Helper to determine whether or not a VLAN has a firewall.
@@ -20,13 +45,7 @@ def has_firewall(vlan):
     :param dict vlan: A dictionary representing a VLAN
     :returns: True if the VLAN has a firewall, false if it doesn't.
     """
-    return bool(
-        vlan.get('dedicatedFirewallFlag', None) or
-        vlan.get('highAvailabilityFirewallFlag', None) or
-        vlan.get('firewallInterfaces', None) or
-        vlan.get('firewallNetworkComponents', None) or
-        vlan.get('firewallGuestNetworkComponents', None)
-    )
+    return any(vlan.get(key) for key in _FIREWALL_KEYS)
 
 
 class FirewallManager(utils.IdentifierMixin, object):
@@ -42,6 +61,8 @@ def __init__(self, client):
         self.client = client
         self.account = self.client['Account']
         self.prod_pkg = self.client['Product_Package']
+        # Firewall package items, keyed by ('std', port_speed) or ('ded', ha_enabled)
+        self._pkg_cache = {}
 
     def get_standard_package(self, server_id, is_virt=True):
         """Retrieves the standard firewall package for the virtual server.
@@ -54,11 +75,13 @@ def get_standard_package(self, server_id, is_virt=True):
         """
 
         firewall_port_speed = self._get_fwl_port_speed(server_id, is_virt)
+        key = ('std', firewall_port_speed)
+        if key not in self._pkg_cache:
+            _value = "%s%s" % (firewall_port_speed, "Mbps Hardware Firewall")
+            _filter = {'items': {'description': utils.query_filter(_value)}}
+            self._pkg_cache[key] = self.prod_pkg.getItems(id=0, filter=_filter)
 
-        _value = "%s%s" % (firewall_port_speed, "Mbps Hardware Firewall")
-        _filter = {'items': {'description': utils.query_filter(_value)}}
-
-        return self.prod_pkg.getItems(id=0, filter=_filter)
+        return self._pkg_cache[key]
 
     def get_dedicated_package(self, ha_enabled=False):
         """Retrieves the dedicated firewall package.
@@ -69,6 +92,10 @@ def get_dedicated_package(self, ha_enabled=False):
                   package
         """
 
+        key = ('ded', ha_enabled)
+        if key in self._pkg_cache:
+            return self._pkg_cache[key]
+
         fwl_filter = 'Hardware Firewall (Dedicated)'
         ha_fwl_filter = 'Hardware Firewall (High Availability)'
         _filter = utils.NestedDict({})
@@ -77,7 +104,8 @@ def get_dedicated_package(self, ha_enabled=False):
         else:
             _filter['items']['description'] = utils.query_filter(fwl_filter)
 
-        return self.prod_pkg.getItems(id=0, filter=_filter.to_dict())
+        self._pkg_cache[key] = self.prod_pkg.getItems(id=0, filter=_filter.to_dict())
+        return self._pkg_cache[key]
 
     def cancel_firewall(self, firewall_id, dedicated=False):
         """Cancels the specified firewall.
@@ -150,7 +178,7 @@ def _get_fwl_billing_item(self, firewall_id, dedicated=False):
         :returns: A dictionary of the firewall billing item.
         """
 
-        mask = 'mask[id,billingItem[id]]'
+        mask = _BILLING_MASK
         if dedicated:
             firewall_service = self.client['Network_Vlan_Firewall']
         else:
@@ -184,28 +212,18 @@ def _get_fwl_port_speed(self, server_id, is_virt=True):
             svc = self.client['Hardware_Server']
             network_components = svc.getFrontendNetworkComponents(
                 mask=mask, id=server_id)
-            grouped = [interface['networkComponentGroup']['networkComponents']
-                       for interface in network_components
-                       if 'networkComponentGroup' in interface]
-            ungrouped = [interface
-                         for interface in network_components
-                         if 'networkComponentGroup' not in interface]
+            grouped, ungrouped = [], []
+            for interface in network_components:
+                if 'networkComponentGroup' in interface:
+                    grouped.append(interface['networkComponentGroup']['networkComponents'])
+                else:
+                    ungrouped.append(interface)
 
             # For each group, sum the maxSpeeds of each compoment in the
-            # group. Put the sum for each in a new list
-            group_speeds = []
-            for group in grouped:
-                group_speed = 0
-                for interface in group:
-                    group_speed += interface['maxSpeed']
-                group_speeds.append(group_speed)
-
-            # The max speed of all groups is the max of the list
-            max_grouped_speed = max(group_speeds)
-
-            max_ungrouped = 0
-            for interface in ungrouped:
-                max_ungrouped = max(max_ungrouped, interface['maxSpeed'])
+            # group. The max speed of all groups is the largest of those sums
+            max_grouped_speed = max((sum(interface['maxSpeed'] for interface in group)
+                                     for group in grouped), default=0)
+            max_ungrouped = max((interface['maxSpeed'] for interface in ungrouped), default=0)
 
             fwl_port_speed = max(max_grouped_speed, max_ungrouped)
 
@@ -263,14 +281,14 @@ def edit_dedicated_fwl_rules(self, firewall_id, rules):
         fwl = svc.getObject(id=firewall_id, mask=mask)
         network_vlan = fwl['networkVlan']
 
-        for fwl1 in network_vlan['firewallInterfaces']:
-            if fwl1['name'] == 'inside':
-                continue
-
-            for control_list in fwl1['firewallContextAccessControlLists']:
-                if control_list['direction'] == 'out':
-                    continue
-                fwl_ctx_acl_id = control_list['id']
+        # The first inbound access control list on a non-inside interface
+        fwl_ctx_acl_id = next((control_list['id']
+                               for fwl1 in network_vlan['firewallInterfaces'] if fwl1['name'] != 'inside'
+                               for control_list in fwl1['firewallContextAccessControlLists']
+                               if control_list['direction'] != 'out'), None)
+        if fwl_ctx_acl_id is None:
+            raise exceptions.SoftLayerError(
+                "Unable to find an access control list for firewall %d" % firewall_id)
 
         template = {'firewallContextAccessControlListId': fwl_ctx_acl_id,
                     'rules': rules}
@@ -297,26 +315,21 @@ def get_instance(self, firewall_id, mask=None):
         :param integer firewall_id: the instance ID of the standard firewall
         """
         if not mask:
-            mask = 'mask[firewallType,datacenter,managementCredentials,networkVlan,' \
-                   'metricTrackingObject[data,type],networkGateway[insideVlans,members,privateIpAddress,' \
-                   'publicIpAddress,publicIpv6Address,privateVlan,publicVlan,status]]'
+            mask = _INSTANCE_MASK
 
         svc = self.client['Network_Vlan_Firewall']
 
         return svc.getObject(id=firewall_id, mask=mask)
 
-    def get_firewalls_gatewalls(self):
+    def get_firewalls_gatewalls(self, include_members=False):
         """Returns a list of all gateway firewalls (gatewalls) on the account.
 
+        :param bool include_members: True to also fetch the gateway members and their hostnames
         returns: A list of gateway firewalls (gatewalls) on the current account.
         """
-        mask = 'mask[id,networkSpace,name,' \
-               'networkFirewall[id,firewallType,datacenter[name]],' \
-               'status[keyName],' \
-               'insideVlans[id],' \
-               'privateIpAddress[ipAddress],' \
-               'publicVlan[id,primaryRouter[hostname]],' \
-               'publicIpAddress[ipAddress],members[id,hardware[hostname]]]'
+        mask = _GATEWALL_MASK
+        if include_members:
+            mask = _GATEWALL_MEMBERS_MASK
         _filter = {"networkGateways": {"networkFirewall": {"operation": "not null"}}}
 
         return self.account.getNetworkGateways(mask=mask, filter=_filter)
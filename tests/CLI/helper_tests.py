@@ -260,6 +260,12 @@ class TestTable(testing.TestCase):
     def test_table_with_duplicated_columns(self):
         self.assertRaises(exceptions.CLIHalt, formatting.Table, ['col', 'col'])
 
+    def test_table_add_rows(self):
+        table = formatting.Table(['id', 'name'])
+        table.add_row([1, 'one'])
+        table.add_rows([[2, 'two'], [3, 'three']])
+        self.assertEqual(table.rows, [[1, 'one'], [2, 'two'], [3, 'three']])
+
 
 class TestFormatOutput(testing.TestCase):
 
@@ -5,8 +5,11 @@
     Tests for the user cli command
 """
 import json
+from unittest import mock as mock
 
+from SoftLayer.CLI.account import bandwidth_pools_detail
 from SoftLayer.fixtures import SoftLayer_Account as SoftLayer_Account
+from SoftLayer.fixtures import SoftLayer_Network_Bandwidth_Version1_Allotment
 from SoftLayer import testing
 
 
@@ -14,6 +17,10 @@ class AccountCLITests(testing.TestCase):
 
     def set_up(self):
         self.SLNOE = 'SoftLayer_Notification_Occurrence_Event'
+        bandwidth_pools_detail._BW_CACHE.clear()
+
+    def tear_down(self):
+        bandwidth_pools_detail._BW_CACHE.clear()
 
     # slcli account event-detail
     def test_event_detail(self):
@@ -159,3 +166,27 @@ def test_acccount_bandwidth_pool_detail(self):
         result = self.run_command(['account', 'bandwidth-pools-detail', '123456'])
         self.assert_no_fail(result)
         self.assert_called_with('SoftLayer_Network_Bandwidth_Version1_Allotment', 'getObject')
+
+    def test_acccount_bandwidth_pool_detail_cached(self):
+        result = self.run_command(['account', 'bandwidth-pools-detail', '654321'])
+        self.assert_no_fail(result)
+        result = self.run_command(['account', 'bandwidth-pools-detail', '654321'])
+        self.assert_no_fail(result)
+        self.assertEqual(len(self.calls('SoftLayer_Network_Bandwidth_Version1_Allotment', 'getObject')), 1)
+
+    @mock.patch('SoftLayer.AccountManager.getBandwidthDetail')
+    def test_acccount_bandwidth_pool_detail_cached_new_client(self, detail_mock):
+        # slcli shell resets env.client before every command, so each run builds a new client
+        detail_mock.return_value = SoftLayer_Network_Bandwidth_Version1_Allotment.getObject
+        for _ in range(3):
+            self.env.client = None
+            result = self.run_command(['account', 'bandwidth-pools-detail', '654321'])
+            self.assert_no_fail(result)
+        self.assertEqual(detail_mock.call_count, 1)
+
+    def test_acccount_bandwidth_pool_detail_cache_evicts_expired(self):
+        bandwidth_pools_detail._BW_CACHE[('expired',)] = (0, {})
+        result = self.run_command(['account', 'bandwidth-pools-detail', '987654'])
+        self.assert_no_fail(result)
+        self.assertNotIn(('expired',), bandwidth_pools_detail._BW_CACHE)
+        self.assertEqual(len(bandwidth_pools_detail._BW_CACHE), 1)
@@ -0,0 +1,84 @@
+"""
+    SoftLayer.tests.CLI.modules.metadata_tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :license: MIT, see LICENSE for more details.
+"""
+import json
+from unittest import mock as mock
+
+import SoftLayer
+from SoftLayer.CLI import exceptions
+from SoftLayer.CLI import metadata
+from SoftLayer import testing
+
+
+class MetadataTests(testing.TestCase):
+
+    def set_up(self):
+        metadata._META = None
+        metadata._get_meta_prop.cache_clear()
+        metadata._get_network_side.cache_clear()
+
+        patcher = mock.patch('SoftLayer.MetadataManager')
+        self.meta_manager = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.meta = self.meta_manager.return_value
+
+    def tear_down(self):
+        metadata._META = None
+        metadata._get_meta_prop.cache_clear()
+        metadata._get_network_side.cache_clear()
+
+    def test_metadata_prop(self):
+        self.meta.get.return_value = 1234
+        result = self.run_command(['metadata', 'id'])
+
+        self.assert_no_fail(result)
+        self.assertEqual(result.output.strip(), '1234')
+        self.meta.get.assert_called_once_with('id')
+
+    def test_metadata_prop_mapping(self):
+        self.meta.get.return_value = '10.0.0.1'
+        result = self.run_command(['metadata', 'backend_ip'])
+
+        self.assert_no_fail(result)
+        self.meta.get.assert_called_once_with('primary_backend_ip')
+
+    def test_metadata_prop_cached(self):
+        self.meta.get.return_value = 'dal13'
+        result = self.run_command(['metadata', 'datacenter'])
+        self.assert_no_fail(result)
+        result = self.run_command(['metadata', 'datacenter'])
+        self.assert_no_fail(result)
+
+        self.assertEqual(result.output.strip(), '"dal13"')
+        self.assertEqual(self.meta.get.call_count, 1)
+        self.assertEqual(self.meta_manager.call_count, 1)
+
+    def test_metadata_network(self):
+        self.meta.public_network.return_value = {
+            'mac_addresses': ['06:00:00:00:00:01'], 'router': 'fcr01.dal13',
+            'vlans': [1001], 'vlan_ids': [11]}
+        self.meta.private_network.return_value = {
+            'mac_addresses': ['06:00:00:00:00:02'], 'router': 'bcr01.dal13',
+            'vlans': [2002], 'vlan_ids': [22]}
+        result = self.run_command(['--format=json', 'metadata', 'network'])
+
+        self.assert_no_fail(result)
+        public, private = json.loads(result.output)
+        self.assertEqual(public['router'], 'fcr01.dal13')
+        self.assertEqual(public['vlan ids'], [11])
+        self.assertEqual(private['router'], 'bcr01.dal13')
+        self.assertEqual(private['vlan ids'], [22])
+        self.assertEqual(self.meta_manager.call_count, 1)
+
+    def test_metadata_network_transport_error(self):
+        self.meta.public_network.return_value = {
+            'mac_addresses': [], 'router': 'fcr01.dal13', 'vlans': [], 'vlan_ids': []}
+        self.meta.private_network.side_effect = SoftLayer.TransportError(0, 'unreachable')
+        result = self.run_command(['metadata', 'network'])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertIsInstance(result.exception, exceptions.CLIAbort)
+        self.assertIn('Cannot connect to the backend service address', result.exception.message)
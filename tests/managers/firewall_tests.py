@@ -125,6 +125,32 @@ def test_get_dedicated_package_pkg(self):
                                 identifier=0,
                                 filter=_filter)
 
+    def test_get_dedicated_package_cached(self):
+        first = self.firewall.get_dedicated_package(ha_enabled=False)
+        second = self.firewall.get_dedicated_package(ha_enabled=False)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 1)
+
+        self.firewall.get_dedicated_package(ha_enabled=True)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 2)
+
+    def test_get_standard_package_cached(self):
+        mock = self.set_mock('SoftLayer_Virtual_Guest', 'getObject')
+        mock.return_value = {'primaryNetworkComponent': {'maxSpeed': 100}}
+        first = self.firewall.get_standard_package(server_id=1234, is_virt=True)
+        second = self.firewall.get_standard_package(server_id=5678, is_virt=True)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 1)
+
+        mock.return_value = {'primaryNetworkComponent': {'maxSpeed': 1000}}
+        self.firewall.get_standard_package(server_id=1234, is_virt=True)
+
+        _filter = {'items': {'description': {'operation': '_= 1000Mbps Hardware Firewall'}}}
+        self.assertEqual(len(self.calls('SoftLayer_Product_Package', 'getItems')), 2)
+        self.assert_called_with('SoftLayer_Product_Package', 'getItems', filter=_filter)
+
     def test_cancel_firewall(self):
         # test standard firewalls
         result = self.firewall.cancel_firewall(6327, dedicated=False)
@@ -250,6 +276,14 @@ def test__get_fwl_port_speed_server(self):
 
         self.assertEqual(port_speed, 2000)
 
+    def test__get_fwl_port_speed_server_ungrouped(self):
+        mock = self.set_mock('SoftLayer_Hardware_Server', 'getFrontendNetworkComponents')
+        mock.return_value = [{'maxSpeed': 100}, {'maxSpeed': 1000}]
+
+        port_speed = self.firewall._get_fwl_port_speed(186908, False)
+
+        self.assertEqual(port_speed, 1000)
+
     def test_add_vlan_firewall(self):
         # test dedicated firewall for Vlan
         self.firewall.add_vlan_firewall(6327, ha_enabled=False)
@@ -310,6 +344,22 @@ def test_edit_dedicated_fwl_rules(self):
                                 'createObject',
                                 args=args)
 
+    def test_edit_dedicated_fwl_rules_no_acl(self):
+        mock = self.set_mock('SoftLayer_Network_Vlan_Firewall', 'getObject')
+        mock.return_value = {
+            'networkVlan': {
+                'firewallInterfaces': [
+                    {'name': 'inside',
+                     'firewallContextAccessControlLists': [{'direction': 'in', 'id': 3142}]},
+                    {'name': 'outside',
+                     'firewallContextAccessControlLists': [{'direction': 'out', 'id': 3143}]}
+                ]
+            }
+        }
+
+        self.assertRaises(exceptions.SoftLayerError,
+                          self.firewall.edit_dedicated_fwl_rules, 1234, [])
+
     def test_edit_standard_fwl_rules(self):
         # test standard firewalls
         rules = fixtures.SoftLayer_Network_Component_Firewall.getRules
@@ -325,3 +375,11 @@ def test_edit_standard_fwl_rules(self):
     def test_get_gateways(self):
         self.firewall.get_firewalls_gatewalls()
         self.assert_called_with('SoftLayer_Account', 'getNetworkGateways')
+        self.assertNotIn('members', self.calls('SoftLayer_Account', 'getNetworkGateways')[0].mask)
+
+    def test_get_gateways_with_members(self):
+        self.firewall.get_firewalls_gatewalls(include_members=True)
+        self.assert_called_with('SoftLayer_Account', 'getNetworkGateways')
+        mask = self.calls('SoftLayer_Account', 'getNetworkGateways')[0].mask
+        self.assertIn('members[id,hardware[hostname]]', mask)
+        self.assertNotIn('primaryRouter', mask)